@@ -6,19 +6,85 @@ including driving limits, rest requirements, and duty status tracking.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Iterator, Tuple, Optional
+from dataclasses import dataclass, field
+from itertools import takewhile
+from pathlib import Path
+import functools
+import logging
 import math
+import orjson
+import os
 import requests
+from requests.adapters import HTTPAdapter
+import sqlite3
+import threading
 import time
+from urllib3.util.retry import Retry
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Used when a location cannot be geocoded
+DEFAULT_COORDINATES = (40.7128, -74.0060)  # New York
+
+# Nominatim's usage policy allows at most one request per second per client
+NOMINATIM_MIN_INTERVAL = 1.0
+
+_rate_limit_lock = threading.Lock()
+_last_request_at = 0.0
+
+# Shared HTTP session so Nominatim connections (TCP + TLS) are kept alive and reused
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Trip-ELD-Navigator/1.0'})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    # 429 is deliberately not retried here: urllib3 would resend immediately,
+    # bypassing _wait_for_rate_limit exactly when Nominatim asked us to slow down
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+))
+
+# On-disk geocode cache shared across processes and restarts
+GEOCODE_CACHE_PATH = Path(os.getenv(
+    'GEOCODE_CACHE_PATH',
+    Path.home() / '.cache' / 'trip-eld' / 'geocode.sqlite'
+))
+
+_geocode_db_lock = threading.Lock()
+_geocode_db = None
+
+
+class RoutingError(Exception):
+    """Raised when a route cannot be planned from the given inputs."""
+
+
+class GeocodingError(RoutingError):
+    """Raised when a location string cannot be resolved to coordinates."""
+
+
+@dataclass(frozen=True)
 class Location:
     """Represents a geographical location with coordinates."""
     name: str
     latitude: float
     longitude: float
+    # Trig terms cached for distance calculations
+    lat_rad: float = field(init=False, repr=False, compare=False)
+    lon_rad: float = field(init=False, repr=False, compare=False)
+    cos_lat: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        lat_rad = math.radians(self.latitude)
+        object.__setattr__(self, 'lat_rad', lat_rad)
+        object.__setattr__(self, 'lon_rad', math.radians(self.longitude))
+        object.__setattr__(self, 'cos_lat', math.cos(lat_rad))
+
+
+@dataclass(frozen=True)
+class FuelStop(Location):
+    """A fueling stop tagged with its distance along the route in miles."""
+    miles_from_start: float
 
 
 @dataclass
@@ -38,50 +104,185 @@ class RouteDetails:
     """Contains comprehensive route information."""
     total_distance: float
     total_time: float
-    fueling_stops: List[Location]
+    fueling_stops: List[FuelStop]
     duty_schedule: List[RoutePoint]
     violations: List[str]
+    # True if any location fell back to DEFAULT_COORDINATES after a failed lookup
+    used_fallback_location: bool = False
+
+
+EARTH_RADIUS_MILES = 3959
+
+# Below this separation (radians, ~1 degree) on both axes the equirectangular
+# approximation is used; its error there is well under a mile, far below what
+# matters for HOS timing at 55 mph.
+SMALL_DISTANCE_THRESHOLD = 0.0175
+
+
+def _haversine_miles(lat1_rad: float, lon1_rad: float, cos_lat1: float,
+                     lat2_rad: float, lon2_rad: float, cos_lat2: float) -> float:
+    """
+    Haversine distance in miles between two points given in radians,
+    with the cosine of each latitude already computed.
+    Nearby points take the cheaper equirectangular approximation.
+    """
+    delta_lat = lat2_rad - lat1_rad
+    delta_lon = lon2_rad - lon1_rad
+    
+    if abs(delta_lat) < SMALL_DISTANCE_THRESHOLD and abs(delta_lon) < SMALL_DISTANCE_THRESHOLD:
+        # Mean of the cached cosines stands in for cos of the mean latitude
+        x = delta_lon * 0.5 * (cos_lat1 + cos_lat2)
+        return EARTH_RADIUS_MILES * math.hypot(x, delta_lat)
+    
+    sin_half_dlat = math.sin(delta_lat * 0.5)
+    sin_half_dlon = math.sin(delta_lon * 0.5)
+    a = sin_half_dlat * sin_half_dlat + cos_lat1 * cos_lat2 * sin_half_dlon * sin_half_dlon
+    # Clamp guards against rounding pushing a past 1.0 for antipodal points
+    return 2.0 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a if a < 1.0 else 1.0))
+
+
+def _wait_for_rate_limit() -> None:
+    """
+    Block until another Nominatim request is allowed.
+    Shared by all threads so the 1 request/second policy holds process-wide.
+    """
+    global _last_request_at
+    with _rate_limit_lock:
+        wait = _last_request_at + NOMINATIM_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request_at = time.monotonic()
+
+
+def _get_geocode_db() -> Optional[sqlite3.Connection]:
+    """
+    Open the on-disk geocode cache, creating it on first use.
+    Returns None if the cache cannot be opened; lookups then go to the network.
+    """
+    global _geocode_db
+    if _geocode_db is None:
+        try:
+            GEOCODE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(GEOCODE_CACHE_PATH), check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geocode "
+                "(query TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+            )
+            db.commit()
+            _geocode_db = db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Geocode cache unavailable at '%s': %s", GEOCODE_CACHE_PATH, e)
+            return None
+    return _geocode_db
+
+
+def _load_cached_coordinates(query: str) -> Optional[Tuple[float, float]]:
+    """
+    Look up a normalized query in the on-disk geocode cache.
+    """
+    with _geocode_db_lock:
+        db = _get_geocode_db()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT lat, lon FROM geocode WHERE query = ?", (query,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+    return (row[0], row[1]) if row else None
+
+
+def _store_cached_coordinates(query: str, lat: float, lon: float) -> None:
+    """
+    Persist geocoded coordinates for a normalized query.
+    """
+    with _geocode_db_lock:
+        db = _get_geocode_db()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO geocode (query, lat, lon, ts) VALUES (?, ?, ?, ?)",
+                (query, lat, lon, int(time.time()))
+            )
+            db.commit()
+        except sqlite3.Error:
+            pass
 
 
 def geocode_location(location_str: str) -> Tuple[float, float]:
     """
     Geocode a location string to coordinates using OpenStreetMap Nominatim.
     
+    Lookups are normalized (trimmed, lowercased) and cached both in memory
+    and on disk, so repeated locations skip the network entirely.
+    
     Args:
         location_str: Location string to geocode
         
     Returns:
-        Tuple of (latitude, longitude)
+        Tuple of (latitude, longitude), or DEFAULT_COORDINATES if geocoding fails
     """
+    try:
+        return _geocode_normalized(_normalize_query(location_str))
+    except GeocodingError as e:
+        logger.warning("%s", e)
+        return DEFAULT_COORDINATES
+
+
+def _normalize_query(location_str: str) -> str:
+    """
+    Normalize a location string into a geocode cache key.
+    """
+    return location_str.strip().lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def _geocode_normalized(query: str) -> Tuple[float, float]:
+    """
+    Geocode an already-normalized query, consulting the on-disk cache first.
+    Raises GeocodingError on failure, so failures are never cached.
+    """
+    cached = _load_cached_coordinates(query)
+    if cached is not None:
+        return cached
+    
     try:
         # Use OpenStreetMap Nominatim API for geocoding
         url = "https://nominatim.openstreetmap.org/search"
         params = {
-            'q': location_str,
+            'q': query,
             'format': 'json',
-            'limit': 1,
-            'addressdetails': 1
-        }
-        headers = {
-            'User-Agent': 'Trip-ELD-Navigator/1.0'
+            'limit': 1
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        _wait_for_rate_limit()
+        response = _SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
-        if data and len(data) > 0:
-            lat = float(data[0]['lat'])
-            lon = float(data[0]['lon'])
-            return lat, lon
-        else:
-            # Fallback to default coordinates if geocoding fails
-            return 40.7128, -74.0060  # New York as default
-            
-    except Exception as e:
-        print(f"Geocoding failed for '{location_str}': {e}")
-        # Fallback to default coordinates
-        return 40.7128, -74.0060
+        data = orjson.loads(response.content)
+        if not data:
+            raise GeocodingError(f"Geocoding failed for '{query}': no results")
+        
+        lat = float(data[0]['lat'])
+        lon = float(data[0]['lon'])
+    except (requests.RequestException, KeyError, IndexError, TypeError, ValueError) as e:
+        raise GeocodingError(f"Geocoding failed for '{query}': {e}") from e
+    
+    _store_cached_coordinates(query, lat, lon)
+    return lat, lon
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_location(location_str: str) -> Location:
+    """
+    Process-wide cache of Location objects keyed by the raw location string.
+    Shared by every HOSCalculator, so warm locations skip geocoding and
+    reuse their precomputed trig terms. Raises GeocodingError on failure.
+    """
+    lat, lon = _geocode_normalized(_normalize_query(location_str))
+    return Location(name=location_str, latitude=lat, longitude=lon)
 
 
 class HOSCalculator:
@@ -96,6 +297,7 @@ class HOSCalculator:
     BREAK_THRESHOLD = 8     
     BREAK_DURATION = 0.5    
     FUELING_INTERVAL = 1000 
+    FUELING_DURATION = 0.5
     PICKUP_TIME = 1         
     DROPOFF_TIME = 1        
     MAX_70_HOUR_WINDOW = 70 
@@ -104,7 +306,11 @@ class HOSCalculator:
     def __init__(self):
         self.current_cycle_used = 0.0
         self.duty_status_history = []
-        self.location_cache = {} 
+        self._status_totals = self._empty_status_totals()
+        self._summarized_schedule = None
+        # Anchor for float-hour schedule times; set per schedule in _generate_duty_schedule
+        self._schedule_start: Optional[datetime] = None
+        self._used_fallback_location = False
         
     def calculate_route(self, 
                        current_location: str,
@@ -122,13 +328,19 @@ class HOSCalculator:
             
         Returns:
             RouteDetails object with complete route information
+            
+        Raises:
+            RoutingError: If a location is blank
         """
+        if not (current_location and pickup_location and dropoff_location):
+            raise RoutingError("Current, pickup and dropoff locations are required")
         self.current_cycle_used = current_cycle_used
+        self._used_fallback_location = False
         
         # Convert string locations to Location objects
-        current_loc = self._parse_location(current_location)
-        pickup_loc = self._parse_location(pickup_location)
-        dropoff_loc = self._parse_location(dropoff_location)
+        current_loc, pickup_loc, dropoff_loc = self._parse_locations_bulk(
+            [current_location, pickup_location, dropoff_location]
+        )
         
         # Calculate distances and times
         distance_to_pickup = self._calculate_distance(current_loc, pickup_loc)
@@ -136,7 +348,10 @@ class HOSCalculator:
         total_distance = distance_to_pickup + distance_pickup_to_dropoff
         
         # Calculate fueling stops
-        fueling_stops = self._calculate_fueling_stops(current_loc, pickup_loc, dropoff_loc)
+        fueling_stops = list(self._iter_fueling_stops(
+            current_loc, pickup_loc, dropoff_loc,
+            distance_to_pickup, distance_pickup_to_dropoff
+        ))
         
         # Generate duty schedule
         duty_schedule = self._generate_duty_schedule(
@@ -156,88 +371,84 @@ class HOSCalculator:
             total_time=total_time,
             fueling_stops=fueling_stops,
             duty_schedule=duty_schedule,
-            violations=violations
+            violations=violations,
+            used_fallback_location=self._used_fallback_location
         )
     
-    def _parse_location(self, location_str: str) -> Location:
+    def _parse_locations_bulk(self, location_strs: List[str]) -> List[Location]:
         """
-        Parse location string into Location object using geocoding.
+        Parse several location strings at once, geocoding each distinct
+        string at most once. Pacing between requests is handled by the
+        shared Nominatim rate limiter.
         """
-        # Check cache first
-        if location_str in self.location_cache:
-            return self.location_cache[location_str]
-        
-        # Geocode the location
-        lat, lon = geocode_location(location_str)
-        
-        # Create location object
-        location = Location(name=location_str, latitude=lat, longitude=lon)
-        
-        # Cache the result
-        self.location_cache[location_str] = location
-        
-        # Add a small delay to respect Nominatim rate limits
-        time.sleep(0.1)
-        
-        return location
+        locations = []
+        for location_str in location_strs:
+            try:
+                locations.append(_cached_location(location_str))
+            except GeocodingError as e:
+                # Fall back without caching, so a transient failure is retried next time
+                logger.warning("%s", e)
+                self._used_fallback_location = True
+                lat, lon = DEFAULT_COORDINATES
+                locations.append(Location(name=location_str, latitude=lat, longitude=lon))
+        return locations
     
     def _calculate_distance(self, loc1: Location, loc2: Location) -> float:
         """
         Calculate distance between two locations using Haversine formula.
         Returns distance in miles.
         """
-        R = 3959  # Earth's radius in miles
-        
-        lat1_rad = math.radians(loc1.latitude)
-        lat2_rad = math.radians(loc2.latitude)
-        delta_lat = math.radians(loc2.latitude - loc1.latitude)
-        delta_lon = math.radians(loc2.longitude - loc1.longitude)
-        
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * 
-             math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        return _haversine_miles(loc1.lat_rad, loc1.lon_rad, loc1.cos_lat,
+                                loc2.lat_rad, loc2.lon_rad, loc2.cos_lat)
     
-    def _calculate_fueling_stops(self, current: Location, pickup: Location, dropoff: Location) -> List[Location]:
+    def _iter_fueling_stops(self,
+                            current: Location,
+                            pickup: Location,
+                            dropoff: Location,
+                            distance_to_pickup: float,
+                            distance_pickup_to_dropoff: float) -> Iterator[FuelStop]:
         """
-        Calculate fueling stops every 1000 miles along the route.
+        Yield fueling stops every 1000 miles along the route, in mileage order.
         """
-        stops = []
-        
-        # Calculate route segments
-        distance_to_pickup = self._calculate_distance(current, pickup)
-        distance_pickup_to_dropoff = self._calculate_distance(pickup, dropoff)
-        
-        # Add stops on the way to pickup
-        miles_so_far = 0
-        while miles_so_far + self.FUELING_INTERVAL < distance_to_pickup:
-            miles_so_far += self.FUELING_INTERVAL
-            stop_location = self._interpolate_location(current, pickup, miles_so_far / distance_to_pickup)
-            stops.append(stop_location)
-        
-        # Add stops from pickup to dropoff
-        miles_so_far = distance_to_pickup
-        while miles_so_far + self.FUELING_INTERVAL < distance_to_pickup + distance_pickup_to_dropoff:
-            miles_so_far += self.FUELING_INTERVAL
-            # Interpolate location
-            progress = (miles_so_far - distance_to_pickup) / distance_pickup_to_dropoff
-            stop_location = self._interpolate_location(pickup, dropoff, progress)
-            stops.append(stop_location)
-        
-        return stops
+        # Short trips never reach a fueling stop
+        if distance_to_pickup + distance_pickup_to_dropoff <= self.FUELING_INTERVAL:
+            return
+        
+        interval = self.FUELING_INTERVAL
+        
+        # Each leg gets a stop at every multiple of the interval strictly inside it
+        stops_to_pickup = math.ceil(distance_to_pickup / interval) - 1
+        stops_to_dropoff = math.ceil(distance_pickup_to_dropoff / interval) - 1
+        
+        # Stops on the way to pickup
+        for k in range(1, stops_to_pickup + 1):
+            yield self._interpolate_location(
+                current, pickup, k * interval / distance_to_pickup, k * interval
+            )
+        
+        # Stops from pickup to dropoff
+        for k in range(1, stops_to_dropoff + 1):
+            yield self._interpolate_location(
+                pickup, dropoff, k * interval / distance_pickup_to_dropoff,
+                distance_to_pickup + k * interval
+            )
     
-    def _interpolate_location(self, start: Location, end: Location, progress: float) -> Location:
+    def _interpolate_location(self,
+                              start: Location,
+                              end: Location,
+                              progress: float,
+                              miles_from_start: float) -> FuelStop:
         """
-        Interpolate a location between start and end based on progress (0-1).
+        Interpolate a fueling stop between start and end based on progress (0-1),
+        tagged with its mileage along the route.
         """
         lat = start.latitude + (end.latitude - start.latitude) * progress
         lon = start.longitude + (end.longitude - start.longitude) * progress
-        return Location(
+        return FuelStop(
             name=f"Fuel Stop at {lat:.2f}, {lon:.2f}",
             latitude=lat,
-            longitude=lon
+            longitude=lon,
+            miles_from_start=miles_from_start
         )
     
     def _generate_duty_schedule(self, 
@@ -246,21 +457,32 @@ class HOSCalculator:
                                dropoff: Location,
                                distance_to_pickup: float,
                                distance_pickup_to_dropoff: float,
-                               fueling_stops: List[Location]) -> List[RoutePoint]:
+                               fueling_stops: List[FuelStop]) -> List[RoutePoint]:
         """
         Generate the complete duty schedule with HOS compliance.
         """
         schedule = []
-        current_time = datetime.now()
-        current_miles = 0.0
+        self._status_totals = self._empty_status_totals()
+        self._summarized_schedule = schedule
+        # Times are tracked as float hours since this anchor and only
+        # converted to datetimes when a RoutePoint is materialized
+        self._schedule_start = datetime.now()
+        start_time = 0.0
         cumulative_driving = self.current_cycle_used
         cumulative_duty = self.current_cycle_used
+        total_distance = distance_to_pickup + distance_pickup_to_dropoff
+        
+        # Split the fueling stops between the two driving segments
+        stops_to_pickup = list(takewhile(
+            lambda stop: stop.miles_from_start < distance_to_pickup, fueling_stops
+        ))
+        stops_to_dropoff = fueling_stops[len(stops_to_pickup):]
         
         # Start at current location
-        schedule.append(RoutePoint(
+        self._append_point(schedule, RoutePoint(
             location=current,
-            arrival_time=current_time,
-            departure_time=current_time,
+            arrival_time=self._at(start_time),
+            departure_time=self._at(start_time),
             status="Off Duty",
             miles_from_start=0.0,
             cumulative_driving_hours=cumulative_driving,
@@ -269,24 +491,25 @@ class HOSCalculator:
         
         # Drive to pickup location
         drive_time = self._calculate_drive_time(distance_to_pickup)
-        arrival_time = current_time + timedelta(hours=drive_time)
-        departure_time = arrival_time + timedelta(hours=self.PICKUP_TIME)
+        arrival_time = start_time + drive_time
+        departure_time = arrival_time + self.PICKUP_TIME
         
         # Check if we need breaks during this drive
-        schedule.extend(self._add_driving_segment(
-            current, pickup, distance_to_pickup, current_time, 
-            cumulative_driving, cumulative_duty, fueling_stops
-        ))
+        for point in self._add_driving_segment(
+            current, pickup, distance_to_pickup, start_time, 
+            cumulative_driving, cumulative_duty, stops_to_pickup
+        ):
+            self._append_point(schedule, point)
         
         # Update cumulative hours
         cumulative_driving += drive_time
         cumulative_duty += drive_time + self.PICKUP_TIME
         
         # Pickup (On Duty Not Driving)
-        schedule.append(RoutePoint(
+        self._append_point(schedule, RoutePoint(
             location=pickup,
-            arrival_time=arrival_time,
-            departure_time=departure_time,
+            arrival_time=self._at(arrival_time),
+            departure_time=self._at(departure_time),
             status="On Duty",
             miles_from_start=distance_to_pickup,
             cumulative_driving_hours=cumulative_driving,
@@ -295,26 +518,28 @@ class HOSCalculator:
         
         # Drive to dropoff location
         drive_time = self._calculate_drive_time(distance_pickup_to_dropoff)
-        arrival_time = departure_time + timedelta(hours=drive_time)
-        departure_time = arrival_time + timedelta(hours=self.DROPOFF_TIME)
+        arrival_time = departure_time + drive_time
+        departure_time = arrival_time + self.DROPOFF_TIME
         
         # Check if we need breaks during this drive
-        schedule.extend(self._add_driving_segment(
+        for point in self._add_driving_segment(
             pickup, dropoff, distance_pickup_to_dropoff, departure_time,
-            cumulative_driving, cumulative_duty, []
-        ))
+            cumulative_driving, cumulative_duty, stops_to_dropoff,
+            start_miles=distance_to_pickup
+        ):
+            self._append_point(schedule, point)
         
         # Update cumulative hours
         cumulative_driving += drive_time
         cumulative_duty += drive_time + self.DROPOFF_TIME
         
         # Dropoff (On Duty Not Driving)
-        schedule.append(RoutePoint(
+        self._append_point(schedule, RoutePoint(
             location=dropoff,
-            arrival_time=arrival_time,
-            departure_time=departure_time,
+            arrival_time=self._at(arrival_time),
+            departure_time=self._at(departure_time),
             status="On Duty",
-            miles_from_start=distance_to_pickup + distance_pickup_to_dropoff,
+            miles_from_start=total_distance,
             cumulative_driving_hours=cumulative_driving,
             cumulative_duty_hours=cumulative_duty
         ))
@@ -322,52 +547,81 @@ class HOSCalculator:
         # Add required off-duty time if needed
         if cumulative_driving >= self.MAX_DRIVING_HOURS or cumulative_duty >= self.MAX_DUTY_HOURS:
             off_duty_start = departure_time
-            off_duty_end = off_duty_start + timedelta(hours=self.MIN_OFF_DUTY_HOURS)
+            off_duty_end = off_duty_start + self.MIN_OFF_DUTY_HOURS
             
-            schedule.append(RoutePoint(
+            self._append_point(schedule, RoutePoint(
                 location=dropoff,
-                arrival_time=off_duty_start,
-                departure_time=off_duty_end,
+                arrival_time=self._at(off_duty_start),
+                departure_time=self._at(off_duty_end),
                 status="Off Duty",
-                miles_from_start=distance_to_pickup + distance_pickup_to_dropoff,
+                miles_from_start=total_distance,
                 cumulative_driving_hours=0.0,  # Reset after off-duty
                 cumulative_duty_hours=0.0      # Reset after off-duty
             ))
         
         return schedule
     
+    @staticmethod
+    def _empty_status_totals() -> Dict[str, float]:
+        """
+        Hours per duty status, all starting at zero.
+        """
+        return {
+            "Driving": 0.0,
+            "On Duty": 0.0,
+            "Sleeper": 0.0,
+            "Off Duty": 0.0
+        }
+    
+    def _at(self, hours: float) -> datetime:
+        """
+        Convert float hours since the schedule start into a datetime.
+        """
+        return self._schedule_start + timedelta(hours=hours)
+    
+    def _append_point(self, schedule: List[RoutePoint], point: RoutePoint) -> None:
+        """
+        Append a point to the schedule, crediting the time since the previous
+        point to the previous point's status in the running totals.
+        """
+        if schedule:
+            previous = schedule[-1]
+            duration = (point.arrival_time - previous.departure_time).total_seconds() / 3600.0
+            self._status_totals[previous.status] += duration
+        schedule.append(point)
+    
     def _add_driving_segment(self, 
                            start: Location, 
                            end: Location, 
                            distance: float,
-                           start_time: datetime,
+                           start_time: float,
                            cumulative_driving: float,
                            cumulative_duty: float,
-                           fueling_stops: List[Location]) -> List[RoutePoint]:
+                           fueling_stops: List[FuelStop],
+                           start_miles: float = 0.0) -> List[RoutePoint]:
         """
         Add a driving segment with proper breaks and fueling stops.
+        start_time is in hours since the schedule start and start_miles is
+        the route mileage at which the segment begins.
         """
         segment_points = []
+        end_miles = start_miles + distance
         current_time = start_time
-        current_miles = 0.0
         current_driving = cumulative_driving
         current_duty = cumulative_duty
         
-        # Calculate driving time for this segment
-        drive_time = self._calculate_drive_time(distance)
-        
         # Check if we need a break during this segment
         if current_driving >= self.BREAK_THRESHOLD:
             # Add 30-minute break
             break_start = current_time
-            break_end = break_start + timedelta(hours=self.BREAK_DURATION)
+            break_end = break_start + self.BREAK_DURATION
             
             segment_points.append(RoutePoint(
                 location=start,
-                arrival_time=break_start,
-                departure_time=break_end,
+                arrival_time=self._at(break_start),
+                departure_time=self._at(break_end),
                 status="Off Duty",
-                miles_from_start=current_miles,
+                miles_from_start=start_miles,
                 cumulative_driving_hours=current_driving,
                 cumulative_duty_hours=current_duty
             ))
@@ -376,43 +630,41 @@ class HOSCalculator:
             current_driving = 0.0  # Reset driving hours after break
             current_duty += self.BREAK_DURATION
         
-        # Add fueling stops along the way
-        for stop in fueling_stops:
-            if current_miles < distance:
-                # Calculate time to reach this stop
-                stop_distance = self._calculate_distance(start, stop)
-                time_to_stop = self._calculate_drive_time(stop_distance)
-                arrival_time = current_time + timedelta(hours=time_to_stop)
-                departure_time = arrival_time + timedelta(minutes=30)  # 30-min fueling
-                
-                segment_points.append(RoutePoint(
-                    location=stop,
-                    arrival_time=arrival_time,
-                    departure_time=departure_time,
-                    status="On Duty",
-                    miles_from_start=current_miles + stop_distance,
-                    cumulative_driving_hours=current_driving + time_to_stop,
-                    cumulative_duty_hours=current_duty + time_to_stop + 0.5
-                ))
-                
-                current_time = departure_time
-                current_miles += stop_distance
-                current_driving += time_to_stop
-                current_duty += time_to_stop + 0.5
+        # Every point's hours follow directly from its mileage into the segment
+        # plus the fueling time spent at the stops before it, so no running
+        # totals are carried from stop to stop.
+        fuel_time = 0.0
+        for stop in fueling_stops:  # ordered by mileage
+            if stop.miles_from_start >= end_miles:
+                break
+            
+            time_driven = self._calculate_drive_time(stop.miles_from_start - start_miles)
+            arrival_time = current_time + time_driven + fuel_time
+            
+            segment_points.append(RoutePoint(
+                location=stop,
+                arrival_time=self._at(arrival_time),
+                departure_time=self._at(arrival_time + self.FUELING_DURATION),
+                status="On Duty",
+                miles_from_start=stop.miles_from_start,
+                cumulative_driving_hours=current_driving + time_driven,
+                cumulative_duty_hours=current_duty + time_driven + fuel_time + self.FUELING_DURATION
+            ))
+            
+            fuel_time += self.FUELING_DURATION
         
         # Add final arrival at destination
-        remaining_distance = distance - current_miles
-        remaining_time = self._calculate_drive_time(remaining_distance)
-        arrival_time = current_time + timedelta(hours=remaining_time)
+        time_driven = self._calculate_drive_time(distance)
+        arrival_time = current_time + time_driven + fuel_time
         
         segment_points.append(RoutePoint(
             location=end,
-            arrival_time=arrival_time,
-            departure_time=arrival_time,
+            arrival_time=self._at(arrival_time),
+            departure_time=self._at(arrival_time),
             status="Driving",
-            miles_from_start=distance,
-            cumulative_driving_hours=current_driving + remaining_time,
-            cumulative_duty_hours=current_duty + remaining_time
+            miles_from_start=end_miles,
+            cumulative_driving_hours=current_driving + time_driven,
+            cumulative_duty_hours=current_duty + time_driven + fuel_time
         ))
         
         return segment_points
@@ -440,32 +692,46 @@ class HOSCalculator:
         Check for HOS violations in the schedule.
         """
         violations = []
-        
-        for i, point in enumerate(schedule):
+        max_driving = self.MAX_DRIVING_HOURS
+        max_duty = self.MAX_DUTY_HOURS
+        max_cycle = self.MAX_70_HOUR_WINDOW
+        duty_limit = min(max_duty, max_cycle)
+        
+        for point in schedule:
+            driving = point.cumulative_driving_hours
+            duty = point.cumulative_duty_hours
+            
+            # Compliant points need only these two comparisons
+            if driving <= max_driving and duty <= duty_limit:
+                continue
+            
+            name = point.location.name
+            
             # Check 11-hour driving limit
-            if point.cumulative_driving_hours > self.MAX_DRIVING_HOURS:
-                violations.append(f"Violation: Exceeded 11-hour driving limit at {point.location.name}")
+            if driving > max_driving:
+                violations.append(f"Violation: Exceeded 11-hour driving limit at {name}")
             
             # Check 14-hour duty limit
-            if point.cumulative_duty_hours > self.MAX_DUTY_HOURS:
-                violations.append(f"Violation: Exceeded 14-hour duty limit at {point.location.name}")
+            if duty > max_duty:
+                violations.append(f"Violation: Exceeded 14-hour duty limit at {name}")
             
             # Check 70-hour/8-day rule (simplified check)
-            if point.cumulative_duty_hours > self.MAX_70_HOUR_WINDOW:
-                violations.append(f"Violation: Exceeded 70-hour/8-day limit at {point.location.name}")
+            if duty > max_cycle:
+                violations.append(f"Violation: Exceeded 70-hour/8-day limit at {name}")
         
         return violations
     
     def get_duty_status_summary(self, schedule: List[RoutePoint]) -> Dict[str, float]:
         """
         Get a summary of duty status hours.
+        
+        Totals for the schedule generated by this calculator are accumulated
+        while it is built, so no second pass is needed for it.
         """
-        summary = {
-            "Driving": 0.0,
-            "On Duty": 0.0,
-            "Sleeper": 0.0,
-            "Off Duty": 0.0
-        }
+        if schedule is self._summarized_schedule:
+            return dict(self._status_totals)
+        
+        summary = self._empty_status_totals()
         
         for i in range(len(schedule) - 1):
             current = schedule[i]
@@ -0,0 +1,47 @@
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    Queue handler that owns a background listener writing to stderr.
+
+    Request threads only format and enqueue records; the listener thread does
+    the stream write, so logging never blocks a request on a slow pipe. The
+    listener is started on the first record in each process: importing the
+    settings (management commands) starts no thread, and workers forked from
+    a preloaded master start their own instead of feeding a dead one.
+    """
+
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+
+    def enqueue(self, record):
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().enqueue(record)
+
+    def _start_listener(self):
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            # A queue inherited across fork has no reader here; start afresh
+            self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, logging.StreamHandler())
+            self._listener.start()
+            self._listener_pid = os.getpid()
+
+    def close(self):
+        # Called by logging.shutdown() at exit; drains and stops the listener
+        with self._listener_lock:
+            if self._listener is not None and self._listener_pid == os.getpid():
+                self._listener.stop()
+            self._listener = None
+            self._listener_pid = None
+        super().close()
@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(obj):
+    """
+    Encode the types orjson does not handle natively.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer for JSON responses using orjson.
+
+    Covers the DRF Response paths (mainly error bodies). datetime values are
+    encoded natively, so callers do not need to pre-format them.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_default)
@@ -1,28 +1,80 @@
+from functools import cached_property
+import math
+
 from rest_framework import serializers
 
 
-class HealthSerializer(serializers.Serializer):
+class LocationField(serializers.CharField):
+    """
+    Location string field shared by the trip input serializers.
+
+    The length limit is checked inline rather than through a
+    MaxLengthValidator, so validation needs no extra validator dispatch.
     """
-    Serializer for health check response.
+    MAX_LENGTH = 200
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.max_length = self.MAX_LENGTH
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if len(value) > self.MAX_LENGTH:
+            self.fail('max_length', max_length=self.MAX_LENGTH)
+        return value
+
+
+class CycleHoursField(serializers.FloatField):
+    """
+    Hours-used-in-cycle field shared by the trip input serializers.
+
+    Bounded to the 70-hour window. NaN and infinity are rejected explicitly,
+    since NaN compares false against both the min and max validators.
     """
-    status = serializers.CharField(max_length=10)
+    MIN_VALUE = 0.0
+    MAX_VALUE = 70.0
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('min_value', self.MIN_VALUE)
+        kwargs.setdefault('max_value', self.MAX_VALUE)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if not math.isfinite(value):
+            self.fail('invalid')
+        return value
+
+
+class CachedFieldsMixin:
+    """
+    Memoize the writable field list on the serializer instance.
+
+    DRF exposes _writable_fields as a generator that re-filters the bound
+    fields on every access; the input serializers only ever need it once
+    per instance, so it is built on first use and reused.
+    """
+
+    @cached_property
+    def _writable_fields(self):
+        return [field for field in self.fields.values() if not field.read_only]
 
 
-class HOSRouteSerializer(serializers.Serializer):
+class HOSRouteSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for HOS route calculation request.
     """
-    current_location = serializers.CharField(max_length=200)
-    pickup_location = serializers.CharField(max_length=200)
-    dropoff_location = serializers.CharField(max_length=200)
-    current_cycle_used = serializers.FloatField(min_value=0.0, max_value=70.0)
+    current_location = LocationField()
+    pickup_location = LocationField()
+    dropoff_location = LocationField()
+    current_cycle_used = CycleHoursField()
 
 
-class TripInputSerializer(serializers.Serializer):
+class TripInputSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for trip input request.
     """
-    current_location = serializers.CharField(max_length=200)
-    pickup_location = serializers.CharField(max_length=200)
-    dropoff_location = serializers.CharField(max_length=200)
-    cycle_hours = serializers.FloatField(min_value=0.0, max_value=70.0)
+    current_location = LocationField()
+    pickup_location = LocationField()
+    dropoff_location = LocationField()
+    cycle_hours = CycleHoursField()
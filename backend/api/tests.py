@@ -1,3 +1,535 @@
+import io
+import math
+import sqlite3
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import orjson
+import requests
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+
+from . import hos_logic, views
+from .hos_logic import EARTH_RADIUS_MILES, FuelStop, RoutingError, calculate_hos_route
+from .parsers import ORJSONParser
+from .serializers import HOSRouteSerializer
+
+
+class GeocodingTestCase(TestCase):
+    """
+    Base test case with Nominatim replaced by a fixed coordinate table and
+    the on-disk geocode cache redirected to a temporary directory.
+    """
+    # Points on the equator, so leg lengths are exact arc lengths
+    COORDINATES = {
+        'origin': (0.0, 0.0),
+        'pickup': (0.0, 25.0),
+        'dropoff': (0.0, 45.0),
+    }
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+
+        patches = [
+            mock.patch.object(hos_logic, 'GEOCODE_CACHE_PATH', Path(cache_dir.name) / 'geocode.sqlite'),
+            mock.patch.object(hos_logic, '_geocode_db', None),
+            mock.patch.object(hos_logic, 'NOMINATIM_MIN_INTERVAL', 0),
+            mock.patch.object(hos_logic._SESSION, 'get', side_effect=self._fake_get),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.session_get = hos_logic._SESSION.get
+
+        # Cleanups run in reverse, so these run before the patches are undone
+        self.addCleanup(self._close_geocode_db)
+        self.addCleanup(self._clear_caches)
+        self._clear_caches()
+
+    def _fake_get(self, url, params=None, timeout=None):
+        coordinates = self.COORDINATES.get(params['q'])
+        if coordinates is None:
+            raise requests.ConnectionError('Nominatim unreachable')
+        response = mock.Mock()
+        response.raise_for_status.return_value = None
+        response.content = orjson.dumps(
+            [{'lat': str(coordinates[0]), 'lon': str(coordinates[1])}]
+        )
+        return response
+
+    @staticmethod
+    def _clear_caches():
+        hos_logic._geocode_normalized.cache_clear()
+        hos_logic._cached_location.cache_clear()
+        views.clear_route_cache()
+        views._cached_logs_bytes.cache_clear()
+
+    @staticmethod
+    def _close_geocode_db():
+        if hos_logic._geocode_db is not None:
+            hos_logic._geocode_db.close()
+
+
+class DistanceTests(TestCase):
+    """
+    The equirectangular shortcut against the full Haversine formula.
+    """
+
+    @staticmethod
+    def haversine(lat1, lon1, lat2, lon2):
+        a = (math.sin((lat2 - lat1) / 2) ** 2
+             + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+        return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+    def distance(self, lat1, lon1, lat2, lon2):
+        return hos_logic._haversine_miles(
+            lat1, lon1, math.cos(lat1), lat2, lon2, math.cos(lat2)
+        )
+
+    def test_short_hops_stay_within_a_mile(self):
+        step = hos_logic.SMALL_DISTANCE_THRESHOLD * 0.99
+        for latitude in (0.0, 30.0, 45.0, 60.0, 70.0):
+            lat = math.radians(latitude)
+            for delta_lat, delta_lon in ((step, 0.0), (0.0, step), (step, step), (-step, step)):
+                with self.subTest(latitude=latitude, delta_lat=delta_lat, delta_lon=delta_lon):
+                    self.assertLess(abs(
+                        self.distance(lat, 0.1, lat + delta_lat, 0.1 + delta_lon)
+                        - self.haversine(lat, 0.1, lat + delta_lat, 0.1 + delta_lon)
+                    ), 1.0)
+
+    def test_long_hops_use_the_exact_formula(self):
+        lat1, lon1, lat2, lon2 = map(math.radians, (41.88, -87.63, 34.05, -118.24))
+        self.assertAlmostEqual(
+            self.distance(lat1, lon1, lat2, lon2), self.haversine(lat1, lon1, lat2, lon2),
+            places=9
+        )
+
+
+class GeocodeCacheTests(GeocodingTestCase):
+    """
+    Normalized, disk-backed geocode cache.
+    """
+
+    def stored_queries(self):
+        with sqlite3.connect(str(hos_logic.GEOCODE_CACHE_PATH)) as db:
+            return [row[0] for row in db.execute("SELECT query FROM geocode")]
+
+    def test_lookups_are_normalized(self):
+        self.assertEqual(hos_logic.geocode_location('  Pickup '), (0.0, 25.0))
+        self.assertEqual(hos_logic.geocode_location('PICKUP'), (0.0, 25.0))
+        self.assertEqual(self.session_get.call_count, 1)
+        self.assertEqual(self.session_get.call_args.kwargs['params']['q'], 'pickup')
+
+    def test_results_persist_to_disk(self):
+        hos_logic.geocode_location('Pickup')
+        self.assertEqual(self.stored_queries(), ['pickup'])
+
+        # A fresh process only has the on-disk cache
+        hos_logic._geocode_normalized.cache_clear()
+        self.session_get.reset_mock()
+        self.assertEqual(hos_logic.geocode_location('pickup'), (0.0, 25.0))
+        self.session_get.assert_not_called()
+
+    def test_failures_are_not_persisted(self):
+        self.assertEqual(
+            hos_logic.geocode_location('unknown place'), hos_logic.DEFAULT_COORDINATES
+        )
+        self.assertEqual(self.stored_queries(), [])
+
+        hos_logic.geocode_location('unknown place')
+        self.assertEqual(self.session_get.call_count, 2)
+
+
+class RateLimiterTests(TestCase):
+    """
+    Pacing of Nominatim requests to one per NOMINATIM_MIN_INTERVAL.
+    """
+
+    def setUp(self):
+        self.clock = mock.Mock()
+        patches = [
+            mock.patch.object(hos_logic, 'time', self.clock),
+            mock.patch.object(hos_logic, 'NOMINATIM_MIN_INTERVAL', 1.0),
+            mock.patch.object(hos_logic, '_last_request_at', 0.0),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_back_to_back_requests_wait_out_the_interval(self):
+        self.clock.monotonic.side_effect = [100.0, 100.0, 100.25, 101.0]
+        hos_logic._wait_for_rate_limit()
+        hos_logic._wait_for_rate_limit()
+        self.clock.sleep.assert_called_once_with(0.75)
+
+    def test_spaced_requests_do_not_wait(self):
+        self.clock.monotonic.side_effect = [100.0, 100.0, 102.0, 102.0]
+        hos_logic._wait_for_rate_limit()
+        hos_logic._wait_for_rate_limit()
+        self.clock.sleep.assert_not_called()
+
+
+class FuelingStopTests(GeocodingTestCase):
+    """
+    Fueling stop placement on a route with one stop on each leg.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.leg_to_pickup = EARTH_RADIUS_MILES * math.radians(25)
+        self.leg_to_dropoff = EARTH_RADIUS_MILES * math.radians(20)
+        self.route = calculate_hos_route('origin', 'pickup', 'dropoff', 0.0)
+
+    def test_route_is_long_enough_for_two_stops(self):
+        self.assertGreater(self.route.total_distance, 2000)
+        self.assertAlmostEqual(
+            self.route.total_distance, self.leg_to_pickup + self.leg_to_dropoff, places=6
+        )
+
+    def test_stops_report_route_wide_mileage(self):
+        first, second = self.route.fueling_stops
+        self.assertAlmostEqual(first.miles_from_start, 1000, places=6)
+        self.assertAlmostEqual(second.miles_from_start, self.leg_to_pickup + 1000, places=6)
+
+    def test_stops_are_interpolated_along_their_leg(self):
+        first, second = self.route.fueling_stops
+        self.assertAlmostEqual(first.latitude, 0.0)
+        self.assertAlmostEqual(first.longitude, 25 * 1000 / self.leg_to_pickup)
+        self.assertAlmostEqual(second.latitude, 0.0)
+        self.assertAlmostEqual(second.longitude, 25 + 20 * 1000 / self.leg_to_dropoff)
+
+    def test_each_segment_schedules_its_own_stop(self):
+        schedule = self.route.duty_schedule
+        fuel_indexes = [
+            i for i, point in enumerate(schedule) if isinstance(point.location, FuelStop)
+        ]
+        pickup_index = next(
+            i for i, point in enumerate(schedule)
+            if point.location.name == 'pickup' and point.status == 'On Duty'
+        )
+
+        self.assertEqual(len(fuel_indexes), 2)
+        self.assertLess(fuel_indexes[0], pickup_index)
+        self.assertGreater(fuel_indexes[1], pickup_index)
+        for index, stop in zip(fuel_indexes, self.route.fueling_stops):
+            self.assertAlmostEqual(schedule[index].miles_from_start, stop.miles_from_start)
+
+    def test_short_route_has_no_stops(self):
+        route = calculate_hos_route('pickup', 'pickup', 'pickup', 0.0)
+        self.assertEqual(route.fueling_stops, [])
+
+
+class HOSCalculatorTests(GeocodingTestCase):
+    """
+    Input handling of the route planner itself.
+    """
+
+    def test_blank_location_raises_routing_error(self):
+        with self.assertRaises(RoutingError):
+            calculate_hos_route('origin', '', 'dropoff', 0.0)
+
+    def test_cycle_hours_over_limit_are_reported_as_violation(self):
+        route = calculate_hos_route('origin', 'pickup', 'dropoff', 75.0)
+        self.assertTrue(any('70-hour' in violation for violation in route.violations))
+
+
+class DutyStatusSummaryTests(GeocodingTestCase):
+    """
+    Status totals accumulated while building a schedule.
+    """
+
+    def test_accumulated_totals_match_pairwise_summary(self):
+        calculator = hos_logic.HOSCalculator()
+        route = calculator.calculate_route('origin', 'pickup', 'dropoff', 9.0)
+
+        accumulated = calculator.get_duty_status_summary(route.duty_schedule)
+        # A copy of the schedule is not the calculator's own, so it is summed pairwise
+        pairwise = calculator.get_duty_status_summary(list(route.duty_schedule))
+
+        self.assertEqual(accumulated.keys(), pairwise.keys())
+        for status_name, hours in pairwise.items():
+            self.assertAlmostEqual(accumulated[status_name], hours, places=9)
+
+
+class RouteResponseTests(GeocodingTestCase):
+    """
+    Memoization, ETags and fallback handling on the route endpoints.
+    """
+    PAYLOAD = {
+        'current_location': 'origin',
+        'pickup_location': 'pickup',
+        'dropoff_location': 'dropoff',
+        'current_cycle_used': 5.0,
+    }
+
+    def setUp(self):
+        super().setUp()
+        # Pin the clock so both requests fall in the same cache window
+        self.clock = mock.Mock(return_value=1_700_000_000.0)
+        patches = [
+            mock.patch.object(views, 'time', mock.Mock(time=self.clock)),
+            mock.patch.object(views, 'calculate_hos_route', wraps=calculate_hos_route),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.plan_route = views.calculate_hos_route
+
+    def post_route(self, payload=None, **extra):
+        return self.client.post(
+            reverse('calculate_route'), payload or self.PAYLOAD,
+            content_type='application/json', **extra
+        )
+
+    def test_matching_etag_returns_not_modified(self):
+        first = self.post_route()
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('ETag', first)
+
+        second = self.post_route(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_etag_distinguishes_separator_characters(self):
+        extra_places = {'x|y': (0.0, 1.0), 'z': (0.0, 2.0), 'x': (0.0, 3.0), 'y|z': (0.0, 4.0)}
+        with mock.patch.dict(self.COORDINATES, extra_places):
+            first = self.post_route(
+                {**self.PAYLOAD, 'current_location': 'x|y', 'pickup_location': 'z'}
+            )
+            second = self.post_route(
+                {**self.PAYLOAD, 'current_location': 'x', 'pickup_location': 'y|z'},
+                HTTP_IF_NONE_MATCH=first['ETag']
+            )
+
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+
+    def test_wildcard_etag_is_ignored_on_post(self):
+        response = self.post_route(HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.plan_route.call_count, 1)
+
+    def test_repeated_route_is_served_from_cache(self):
+        first = self.post_route()
+        second = self.post_route()
+
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(self.plan_route.call_count, 1)
+
+    def test_cached_route_expires_with_its_window(self):
+        first = self.post_route()
+        self.clock.return_value += views.ROUTE_CACHE_TTL
+        second = self.post_route()
+
+        self.assertEqual(self.plan_route.call_count, 2)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+
+    def test_fallback_route_is_not_cached(self):
+        payload = {**self.PAYLOAD, 'current_location': 'unknown place'}
+        first = self.post_route(payload)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn('ETag', first)
+        self.assertEqual(first['Cache-Control'], 'no-store')
+
+        calls = self.session_get.call_count
+        self.post_route(payload)
+        self.assertGreater(self.session_get.call_count, calls)
+        self.assertEqual(self.plan_route.call_count, 2)
+
+    def test_routing_error_returns_json_400(self):
+        self.plan_route.side_effect = RoutingError('bad trip')
+        with self.assertLogs('api.views', level='WARNING') as logs:
+            response = self.post_route()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Route calculation failed: bad trip'})
+        self.assertEqual(logs.records[0].levelname, 'WARNING')
+        self.assertIsNone(logs.records[0].exc_info)
+
+    def test_unexpected_planning_error_returns_json_500(self):
+        self.plan_route.side_effect = ZeroDivisionError('boom')
+        with self.assertLogs('api.views', level='ERROR'):
+            response = self.post_route()
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'error': 'Route calculation failed: boom'})
+
+    def test_route_accepts_form_data(self):
+        response = self.client.post(reverse('route'), {
+            'current_location': 'origin',
+            'pickup_location': 'pickup',
+            'dropoff_location': 'dropoff',
+            'cycle_hours': '5',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('summary', response.json())
+
+    def test_route_requests_reuse_the_pooled_serializer(self):
+        trip = {
+            'current_location': 'origin',
+            'pickup_location': 'pickup',
+            'dropoff_location': 'dropoff',
+        }
+        invalid = self.client.post(
+            reverse('route'), {**trip, 'cycle_hours': 80.0}, content_type='application/json'
+        )
+        self.assertEqual(invalid.status_code, 400)
+        pooled = getattr(views._serializer_pool, 'TripInputSerializer')
+
+        valid = self.client.post(
+            reverse('route'), {**trip, 'cycle_hours': 5.0}, content_type='application/json'
+        )
+        self.assertEqual(valid.status_code, 200)
+        self.assertIs(getattr(views._serializer_pool, 'TripInputSerializer'), pooled)
+
+
+class LogSheetTests(TestCase):
+    """
+    Log sheet bodies, cached and streamed.
+    """
+
+    def setUp(self):
+        views._cached_logs_bytes.cache_clear()
+        self.addCleanup(views._cached_logs_bytes.cache_clear)
+
+    def get_logs(self, start, end, **extra):
+        return self.client.get(
+            reverse('logs'), {'start_date': start, 'end_date': end}, **extra
+        )
+
+    def assert_entries(self, entries, start, day_count):
+        self.assertEqual(
+            [entry['date'] for entry in entries],
+            [(start + timedelta(days=i)).isoformat() for i in range(day_count)]
+        )
+        for day_index, entry in enumerate(entries):
+            blocks = entry['time_blocks']
+            self.assertEqual(blocks[0]['start_time'], f"{8 + day_index % 4:02d}:00")
+            self.assertEqual(
+                blocks[0]['notes'], 'pickup en route' if day_index % 2 == 0 else 'fuel stop'
+            )
+            self.assertEqual(
+                blocks[2]['notes'], 'rest' if day_index % 3 == 0 else 'route to dropoff'
+            )
+            self.assertEqual(entry['daily_totals'], {
+                'driving_hours': 8.0,
+                'on_duty_hours': 2.0,
+                'off_duty_hours': 14.0,
+                'total_miles': 400,
+            })
+
+    def test_short_range_returns_expected_entries(self):
+        response = self.get_logs('2024-01-01', '2024-01-05')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+
+        log_sheet = response.json()['log_sheet']
+        self.assertEqual(log_sheet['start_date'], '2024-01-01T00:00:00')
+        self.assertEqual(log_sheet['end_date'], '2024-01-05T00:00:00')
+        self.assert_entries(log_sheet['entries'], date(2024, 1, 1), 5)
+
+    def test_long_range_is_streamed_with_the_cached_body(self):
+        response = self.get_logs('2024-01-01', '2024-03-01')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+
+        body = b''.join(response.streaming_content)
+        self.assertEqual(body, views._cached_logs_bytes(
+            datetime(2024, 1, 1).isoformat(), datetime(2024, 3, 1).isoformat()
+        ))
+        # Spans 29 February
+        self.assert_entries(orjson.loads(body)['log_sheet']['entries'], date(2024, 1, 1), 61)
+
+    def test_reversed_range_has_no_entries(self):
+        response = self.get_logs('2024-01-05', '2024-01-01')
+        self.assertEqual(response.json()['log_sheet']['entries'], [])
+
+    def test_matching_etag_returns_not_modified(self):
+        first = self.get_logs('2024-01-01', '2024-01-05')
+        second = self.get_logs(
+            '2024-01-01', '2024-01-05', HTTP_IF_NONE_MATCH=first['ETag']
+        )
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_wildcard_etag_matches_on_get(self):
+        response = self.get_logs('2024-01-01', '2024-01-05', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 304)
+
+    def test_invalid_date_is_rejected(self):
+        response = self.get_logs('not-a-date', '2024-01-05')
+        self.assertEqual(response.status_code, 400)
+
+
+class PooledSerializerTests(TestCase):
+    """
+    Thread-pooled input serializers must not leak state between requests.
+    """
+    VALID = {
+        'current_location': 'origin',
+        'pickup_location': 'pickup',
+        'dropoff_location': 'dropoff',
+        'current_cycle_used': 5.0,
+    }
+
+    def test_pooled_serializer_is_reused_after_invalid_input(self):
+        invalid = views._pooled_serializer(
+            HOSRouteSerializer, {**self.VALID, 'current_cycle_used': 80.0}
+        )
+        self.assertFalse(invalid.is_valid())
+        self.assertIn('current_cycle_used', invalid.errors)
+
+        valid = views._pooled_serializer(HOSRouteSerializer, self.VALID)
+        self.assertIs(valid, invalid)
+        self.assertTrue(valid.is_valid())
+        self.assertEqual(valid.errors, {})
+        self.assertEqual(valid.validated_data['current_cycle_used'], 5.0)
+
+    def test_nan_cycle_hours_are_rejected(self):
+        serializer = views._pooled_serializer(
+            HOSRouteSerializer, {**self.VALID, 'current_cycle_used': 'nan'}
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('current_cycle_used', serializer.errors)
+
+
+class ORJSONParserTests(TestCase):
+    """
+    JSON request bodies parsed with orjson.
+    """
+
+    def test_parses_json_body(self):
+        parsed = ORJSONParser().parse(io.BytesIO(b'{"cycle_hours": 5.5}'))
+        self.assertEqual(parsed, {'cycle_hours': 5.5})
+
+    def test_malformed_body_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"cycle_hours": '))
+
+    def test_malformed_body_returns_400(self):
+        response = self.client.post(
+            reverse('calculate_route'), b'{"current_location": ', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()['detail'].startswith('JSON parse error'))
+
+
+class HealthCheckTests(TestCase):
+    """
+    Static health-check body and its short client cache.
+    """
+
+    def test_returns_static_body(self):
+        response = self.client.get(reverse('health_check'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'{"status":"ok"}')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('max-age=5', response['Cache-Control'])
 
-# Create your tests here.
+    def test_rejects_post(self):
+        response = self.client.post(reverse('health_check'))
+        self.assertEqual(response.status_code, 405)
@@ -1,18 +1,279 @@
+from django.http import (
+    HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+)
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_GET
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from .hos_logic import calculate_hos_route
-from .serializers import HealthSerializer, HOSRouteSerializer, TripInputSerializer
-from datetime import datetime, timedelta
-import json
+from .hos_logic import RoutingError, calculate_hos_route
+from .renderers import _default
+from .serializers import HOSRouteSerializer, TripInputSerializer
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+import functools
+import hashlib
+import logging
+import operator
+import orjson
+import threading
+import time
 
 
-@api_view(['GET'])
+logger = logging.getLogger(__name__)
+
+
+def _json_response(payload, status_code=status.HTTP_200_OK):
+    """
+    Encode a payload with orjson and wrap it in a plain HttpResponse,
+    bypassing DRF's renderer pipeline. Datetimes are emitted as ISO 8601.
+    """
+    return HttpResponse(
+        orjson.dumps(payload, default=_default),
+        content_type="application/json",
+        status=status_code
+    )
+
+
+def _etag_matches(request, etag):
+    """
+    Check whether the request's If-None-Match header lists the given ETag.
+    
+    "*" only counts for GET and HEAD: for other methods RFC 9110 requires a
+    412 rather than a 304, so it is not treated as a match there.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+    accepted = (etag, '*') if request.method in ('GET', 'HEAD') else (etag,)
+    return any(tag.strip() in accepted for tag in if_none_match.split(','))
+
+
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+@require_GET
+@cache_control(max_age=5)
 def health_check(request):
     """
     Health check endpoint that returns the status of the API.
+    Served as a prebuilt body without DRF's request/response cycle.
+    """
+    return HttpResponse(_HEALTH_BODY, content_type="application/json")
+
+
+# Planned routes are memoized briefly; schedules are anchored at the current
+# time, so a cached body is only served within the same TTL window.
+ROUTE_CACHE_TTL = 60  # seconds
+ROUTE_CACHE_MAXSIZE = 2048
+
+# (with_summary, trip inputs) -> (expires_at, encoded body), least recently used first
+_route_cache = OrderedDict()
+_route_cache_lock = threading.Lock()
+
+
+def _load_cached_route(key, now):
+    """
+    Return the cached body for key, or None if it is missing or expired.
+    """
+    with _route_cache_lock:
+        entry = _route_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= now:
+            del _route_cache[key]
+            return None
+        _route_cache.move_to_end(key)
+        return body
+
+
+def _store_cached_route(key, body, expires_at, now):
+    """
+    Cache a route body until expires_at, evicting expired and least recently
+    used entries to stay within ROUTE_CACHE_MAXSIZE.
+    """
+    with _route_cache_lock:
+        _route_cache[key] = (expires_at, body)
+        _route_cache.move_to_end(key)
+        while _route_cache:
+            oldest_key, (oldest_expires_at, _) = next(iter(_route_cache.items()))
+            if len(_route_cache) <= ROUTE_CACHE_MAXSIZE and oldest_expires_at > now:
+                break
+            del _route_cache[oldest_key]
+
+
+def _route_response(request, current_location, pickup_location, dropoff_location,
+                    current_cycle_used, *, with_summary):
+    """
+    Serve a planned route, from the body cache when possible.
+    
+    The ETag is derived from the cache key, so a client repeating the same
+    trip within the TTL window gets a 304 without the route being planned.
+    Routes planned on fallback coordinates are neither cached nor tagged,
+    so a failed geocode is retried on the next request.
+    """
+    now = time.time()
+    cycle_used = round(current_cycle_used, 2)
+    ttl_bucket = int(now // ROUTE_CACHE_TTL)
+    
+    # Weak ETag: workers plan from their own clock, so bodies for the same key
+    # are equivalent but not byte-identical across processes. The key is
+    # hashed as a JSON array, since location strings may contain any separator.
+    etag = 'W/"%s"' % hashlib.blake2b(
+        orjson.dumps([
+            with_summary, current_location, pickup_location, dropoff_location,
+            cycle_used, ttl_bucket
+        ]),
+        digest_size=16
+    ).hexdigest()
+    if _etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        key = (with_summary, current_location, pickup_location, dropoff_location, cycle_used)
+        body = _load_cached_route(key, now)
+        if body is None:
+            try:
+                route_details = calculate_hos_route(
+                    current_location=current_location,
+                    pickup_location=pickup_location,
+                    dropoff_location=dropoff_location,
+                    current_cycle_used=cycle_used
+                )
+            except RoutingError as e:
+                logger.warning("Route calculation rejected: %s", e)
+                return _json_response(
+                    {"error": f"Route calculation failed: {str(e)}"},
+                    status.HTTP_400_BAD_REQUEST
+                )
+            except Exception as e:
+                logger.exception("Route calculation failed")
+                return _json_response(
+                    {"error": f"Route calculation failed: {str(e)}"},
+                    status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            body = orjson.dumps(
+                _build_route_payload(route_details, with_summary=with_summary),
+                default=_default
+            )
+            if route_details.used_fallback_location:
+                # Planned on fallback coordinates: serve once, without an ETag
+                response = HttpResponse(body, content_type="application/json")
+                response['Cache-Control'] = 'no-store'
+                return response
+            # Expire with the TTL window, so the body always matches the ETag
+            _store_cached_route(key, body, (ttl_bucket + 1) * ROUTE_CACHE_TTL, now)
+        response = HttpResponse(body, content_type="application/json")
+    
+    # Clients may reuse the body only until the current TTL window closes
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, max-age=%d' % (
+        ROUTE_CACHE_TTL - int(now % ROUTE_CACHE_TTL)
+    )
+    return response
+
+
+def clear_route_cache():
+    """
+    Drop all memoized route responses, e.g. after HOS rules or data change.
+    """
+    with _route_cache_lock:
+        _route_cache.clear()
+
+
+# Response keys and the attributes they are read from. attrgetter fetches all
+# fields of an object in one C-level call instead of one lookup per field.
+_STOP_KEYS = ("name", "latitude", "longitude")
+_get_stop_fields = operator.attrgetter(*_STOP_KEYS)
+_POINT_ATTRS = (
+    "arrival_time", "departure_time", "status", "miles_from_start",
+    "cumulative_driving_hours", "cumulative_duty_hours"
+)
+_get_point_fields = operator.attrgetter(*_POINT_ATTRS)
+_DUTY_POINT_KEYS = ("location", "latitude", "longitude") + _POINT_ATTRS
+
+
+def _serialize_fueling_stops(fueling_stops):
+    """
+    Convert fueling stops to response dictionaries.
+    """
+    return [dict(zip(_STOP_KEYS, _get_stop_fields(stop))) for stop in fueling_stops]
+
+
+def _serialize_duty_point(point, point_fields):
+    """
+    Convert a RoutePoint to a response dictionary, given its already-fetched
+    _POINT_ATTRS values.
+    """
+    return dict(zip(_DUTY_POINT_KEYS, _get_stop_fields(point.location) + point_fields))
+
+
+def _build_route_payload(route_details, *, with_summary):
+    """
+    Convert RouteDetails to a route response dictionary.
+    
+    with_summary=False gives the flat calculate-route shape; with_summary=True
+    nests the totals under "route" and adds the summary block.
+    """
+    # Serialize the duty schedule and collect the summary maxima in one pass
+    duty_schedule = []
+    max_driving = 0.0
+    max_duty = 0.0
+    for point in route_details.duty_schedule:
+        point_fields = _get_point_fields(point)
+        driving = point_fields[4]
+        duty = point_fields[5]
+        if driving > max_driving:
+            max_driving = driving
+        if duty > max_duty:
+            max_duty = duty
+        duty_schedule.append(_serialize_duty_point(point, point_fields))
+    
+    route_info = {
+        "total_distance": route_details.total_distance,
+        "total_time": route_details.total_time,
+        "fueling_stops": _serialize_fueling_stops(route_details.fueling_stops)
+    }
+    if not with_summary:
+        return {
+            **route_info,
+            "duty_schedule": duty_schedule,
+            "violations": route_details.violations
+        }
+    
+    # Format response with route and duty schedule
+    return {
+        "route": route_info,
+        "duty_schedule": duty_schedule,
+        "violations": route_details.violations,
+        "summary": {
+            "total_driving_hours": max_driving,
+            "total_duty_hours": max_duty,
+            "fuel_stops_count": len(route_details.fueling_stops),
+            "has_violations": len(route_details.violations) > 0
+        }
+    }
+
+
+# Input serializers are reused per thread: their bound fields and cached
+# writable field list survive between requests, only the data is swapped.
+_serializer_pool = threading.local()
+
+
+def _pooled_serializer(serializer_class, data):
     """
-    return Response({"status": "ok"}, status=status.HTTP_200_OK)
+    Return this thread's instance of serializer_class, reset to validate data.
+    """
+    serializer = getattr(_serializer_pool, serializer_class.__name__, None)
+    if serializer is None:
+        serializer = serializer_class()
+        setattr(_serializer_pool, serializer_class.__name__, serializer)
+    else:
+        # Drop the previous request's results so is_valid() runs again
+        for attr in ('_validated_data', '_errors', '_data'):
+            serializer.__dict__.pop(attr, None)
+    serializer.initial_data = data
+    return serializer
 
 
 @api_view(['POST'])
@@ -28,50 +289,16 @@ def calculate_route(request):
         "current_cycle_used": float
     }
     """
-    serializer = HOSRouteSerializer(data=request.data)
+    serializer = _pooled_serializer(HOSRouteSerializer, request.data)
     if serializer.is_valid():
-        try:
-            route_details = calculate_hos_route(
-                current_location=serializer.validated_data['current_location'],
-                pickup_location=serializer.validated_data['pickup_location'],
-                dropoff_location=serializer.validated_data['dropoff_location'],
-                current_cycle_used=serializer.validated_data['current_cycle_used']
-            )
-            
-            # Convert RouteDetails to dictionary for JSON response
-            response_data = {
-                "total_distance": route_details.total_distance,
-                "total_time": route_details.total_time,
-                "fueling_stops": [
-                    {
-                        "name": stop.name,
-                        "latitude": stop.latitude,
-                        "longitude": stop.longitude
-                    } for stop in route_details.fueling_stops
-                ],
-                "duty_schedule": [
-                    {
-                        "location": point.location.name,
-                        "latitude": point.location.latitude,
-                        "longitude": point.location.longitude,
-                        "arrival_time": point.arrival_time.isoformat(),
-                        "departure_time": point.departure_time.isoformat(),
-                        "status": point.status,
-                        "miles_from_start": point.miles_from_start,
-                        "cumulative_driving_hours": point.cumulative_driving_hours,
-                        "cumulative_duty_hours": point.cumulative_duty_hours
-                    } for point in route_details.duty_schedule
-                ],
-                "violations": route_details.violations
-            }
-            
-            return Response(response_data, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            return Response(
-                {"error": f"Route calculation failed: {str(e)}"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return _route_response(
+            request,
+            serializer.validated_data['current_location'],
+            serializer.validated_data['pickup_location'],
+            serializer.validated_data['dropoff_location'],
+            serializer.validated_data['current_cycle_used'],
+            with_summary=False
+        )
     else:
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -89,62 +316,38 @@ def route(request):
         "cycle_hours": float
     }
     """
-    serializer = TripInputSerializer(data=request.data)
+    serializer = _pooled_serializer(TripInputSerializer, request.data)
     if serializer.is_valid():
-        try:
-            route_details = calculate_hos_route(
-                current_location=serializer.validated_data['current_location'],
-                pickup_location=serializer.validated_data['pickup_location'],
-                dropoff_location=serializer.validated_data['dropoff_location'],
-                current_cycle_used=serializer.validated_data['cycle_hours']
-            )
-            
-            # Format response with route and duty schedule
-            response_data = {
-                "route": {
-                    "total_distance": route_details.total_distance,
-                    "total_time": route_details.total_time,
-                    "fueling_stops": [
-                        {
-                            "name": stop.name,
-                            "latitude": stop.latitude,
-                            "longitude": stop.longitude
-                        } for stop in route_details.fueling_stops
-                    ]
-                },
-                "duty_schedule": [
-                    {
-                        "location": point.location.name,
-                        "latitude": point.location.latitude,
-                        "longitude": point.location.longitude,
-                        "arrival_time": point.arrival_time.isoformat(),
-                        "departure_time": point.departure_time.isoformat(),
-                        "status": point.status,
-                        "miles_from_start": point.miles_from_start,
-                        "cumulative_driving_hours": point.cumulative_driving_hours,
-                        "cumulative_duty_hours": point.cumulative_duty_hours
-                    } for point in route_details.duty_schedule
-                ],
-                "violations": route_details.violations,
-                "summary": {
-                    "total_driving_hours": max([point.cumulative_driving_hours for point in route_details.duty_schedule], default=0),
-                    "total_duty_hours": max([point.cumulative_duty_hours for point in route_details.duty_schedule], default=0),
-                    "fuel_stops_count": len(route_details.fueling_stops),
-                    "has_violations": len(route_details.violations) > 0
-                }
-            }
-            
-            return Response(response_data, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            return Response(
-                {"error": f"Route calculation failed: {str(e)}"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return _route_response(
+            request,
+            serializer.validated_data['current_location'],
+            serializer.validated_data['pickup_location'],
+            serializer.validated_data['dropoff_location'],
+            serializer.validated_data['cycle_hours'],
+            with_summary=True
+        )
     else:
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+# Ranges longer than this many days are streamed rather than cached in memory
+LOG_STREAM_THRESHOLD_DAYS = 30
+
+# datetime.time(0, 0); the time module name is taken by the stdlib import
+_MIDNIGHT = datetime.min.time()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(value):
+    """
+    Parse an ISO 8601 date string, memoized for repeated query values.
+    
+    datetime objects are immutable, so cached results are safe to share;
+    invalid strings still raise ValueError and are not cached.
+    """
+    return datetime.fromisoformat(value)
+
+
 @api_view(['GET'])
 def logs(request):
     """
@@ -161,25 +364,36 @@ def logs(request):
         
         # Parse dates or use defaults
         if start_date_str:
-            start_date = datetime.fromisoformat(start_date_str)
+            start_date = _parse_iso(start_date_str)
         else:
-            start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            start_date = datetime.combine(date.today(), _MIDNIGHT)
             
         if end_date_str:
-            end_date = datetime.fromisoformat(end_date_str)
+            end_date = _parse_iso(end_date_str)
         else:
             end_date = start_date + timedelta(days=7)
         
-        # Generate sample log sheet entries (in production, this would come from database)
-        log_entries = generate_log_sheet_entries(start_date, end_date)
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
         
-        return Response({
-            "log_sheet": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-                "entries": log_entries
-            }
-        }, status=status.HTTP_200_OK)
+        # Log sheets are deterministic per date range, so the range identifies the body
+        # (weak ETag: equivalent content, not a byte-for-byte guarantee across deploys)
+        etag = 'W/"%s"' % hashlib.blake2b(
+            f"{start_iso}|{end_iso}".encode(), digest_size=16
+        ).hexdigest()
+        if _etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        elif (end_date - start_date).days > LOG_STREAM_THRESHOLD_DAYS:
+            # Long ranges are streamed day by day instead of built and cached whole
+            response = StreamingHttpResponse(
+                _stream_logs(start_date, end_date), content_type="application/json"
+            )
+        else:
+            body = _cached_logs_bytes(start_iso, end_iso)
+            response = HttpResponse(body, content_type="application/json")
+        
+        response['ETag'] = etag
+        return response
         
     except ValueError as e:
         return Response(
@@ -193,85 +407,143 @@ def logs(request):
         )
 
 
-def generate_log_sheet_entries(start_date, end_date):
+def _add_hours_str(hhmm: str, hours: int) -> str:
     """
-    Generate sample log sheet entries for demonstration.
-    In production, this would query the database for actual duty records.
+    Shift an "HH:MM" clock time by whole hours, wrapping at midnight.
+    """
+    base_h, base_m = map(int, hhmm.split(":"))
+    total = (base_h + hours) % 24
+    return f"{total:02d}:{base_m:02d}"
+
+
+def _build_day_template(day_index):
+    """
+    Build the sample log sheet body (everything but the date) for a day
+    at the given offset from the start of the range.
     """
-    entries = []
-    current_date = start_date
+    # Per-day variation so sheets are not identical
+    shift_hours = (day_index % 4)  # 0..3 hour shift
     
-    while current_date <= end_date:
-        # Per-day variation so sheets are not identical
-        day_index = (current_date - start_date).days
-        shift_hours = (day_index % 4)  # 0..3 hour shift
-
-        def add_hours_str(hhmm: str, hours: int) -> str:
-            base_h, base_m = map(int, hhmm.split(":"))
-            total = (base_h + hours) % 24
-            return f"{total:02d}:{base_m:02d}"
-
-        # Generate sample entries for each day with a small time shift
-        day_entries = [
+    return {
+        "time_blocks": [
+            {
+                "start_time": _add_hours_str("08:00", shift_hours),
+                "end_time": _add_hours_str("12:00", shift_hours),
+                "status": "Driving",
+                "location": "Highway I-95",
+                "odometer_start": 125000,
+                "odometer_end": 125200,
+                "notes": "pickup en route" if day_index % 2 == 0 else "fuel stop"
+            },
+            {
+                "start_time": _add_hours_str("12:00", shift_hours),
+                "end_time": _add_hours_str("13:00", shift_hours),
+                "status": "On Duty",
+                "location": "Pickup Location",
+                "odometer_start": 125200,
+                "odometer_end": 125200,
+                "notes": "Loading cargo"
+            },
             {
-                "date": current_date.strftime("%Y-%m-%d"),
-                "time_blocks": [
-                    {
-                        "start_time": add_hours_str("08:00", shift_hours),
-                        "end_time": add_hours_str("12:00", shift_hours),
-                        "status": "Driving",
-                        "location": "Highway I-95",
-                        "odometer_start": 125000,
-                        "odometer_end": 125200,
-                        "notes": "pickup en route" if day_index % 2 == 0 else "fuel stop"
-                    },
-                    {
-                        "start_time": add_hours_str("12:00", shift_hours),
-                        "end_time": add_hours_str("13:00", shift_hours),
-                        "status": "On Duty",
-                        "location": "Pickup Location",
-                        "odometer_start": 125200,
-                        "odometer_end": 125200,
-                        "notes": "Loading cargo"
-                    },
-                    {
-                        "start_time": add_hours_str("13:00", shift_hours),
-                        "end_time": add_hours_str("17:00", shift_hours),
-                        "status": "Driving",
-                        "location": "Highway I-80",
-                        "odometer_start": 125200,
-                        "odometer_end": 125400,
-                        "notes": "rest" if day_index % 3 == 0 else "route to dropoff"
-                    },
-                    {
-                        "start_time": add_hours_str("17:00", shift_hours),
-                        "end_time": add_hours_str("18:00", shift_hours),
-                        "status": "On Duty",
-                        "location": "Dropoff Location",
-                        "odometer_start": 125400,
-                        "odometer_end": 125400,
-                        "notes": "Unloading cargo"
-                    },
-                    {
-                        "start_time": add_hours_str("18:00", shift_hours),
-                        "end_time": add_hours_str("08:00", shift_hours),
-                        "status": "Off Duty",
-                        "location": "Rest Area",
-                        "odometer_start": 125400,
-                        "odometer_end": 125400,
-                        "notes": "10-hour rest period"
-                    }
-                ],
-                "daily_totals": {
-                    "driving_hours": 8.0,
-                    "on_duty_hours": 2.0,
-                    "off_duty_hours": 14.0,
-                    "total_miles": 400
-                }
+                "start_time": _add_hours_str("13:00", shift_hours),
+                "end_time": _add_hours_str("17:00", shift_hours),
+                "status": "Driving",
+                "location": "Highway I-80",
+                "odometer_start": 125200,
+                "odometer_end": 125400,
+                "notes": "rest" if day_index % 3 == 0 else "route to dropoff"
+            },
+            {
+                "start_time": _add_hours_str("17:00", shift_hours),
+                "end_time": _add_hours_str("18:00", shift_hours),
+                "status": "On Duty",
+                "location": "Dropoff Location",
+                "odometer_start": 125400,
+                "odometer_end": 125400,
+                "notes": "Unloading cargo"
+            },
+            {
+                "start_time": _add_hours_str("18:00", shift_hours),
+                "end_time": _add_hours_str("08:00", shift_hours),
+                "status": "Off Duty",
+                "location": "Rest Area",
+                "odometer_start": 125400,
+                "odometer_end": 125400,
+                "notes": "10-hour rest period"
             }
-        ]
-        
-        entries.extend(day_entries)
-        current_date += timedelta(days=1)
+        ],
+        "daily_totals": {
+            "driving_hours": 8.0,
+            "on_duty_hours": 2.0,
+            "off_duty_hours": 14.0,
+            "total_miles": 400
+        }
+    }
+
+
+# The sample days repeat every 12 days (4-day shift cycle x 2- and 3-day note
+# cycles), so their bodies are encoded once at import. Each template is the
+# entry's JSON after the leading "date" member, i.e. starting at the comma.
+_DAY_TEMPLATE_CYCLE = 12
+_DAY_ENTRY_TAILS = tuple(
+    orjson.dumps(_build_day_template(i))[1:] for i in range(_DAY_TEMPLATE_CYCLE)
+)
+_DAY_ENTRY_HEAD = b'{"date":"'
+
+
+def iter_log_sheet_entries(start_date, end_date):
+    """
+    Yield sample log sheet entries for demonstration as encoded JSON objects.
+    In production, this would query the database for actual duty records.
+    
+    Only the date differs between days in the same cycle position, so each
+    entry is the date spliced into a pre-encoded template.
+    """
+    day_count = (end_date - start_date).days + 1
+    start_ordinal = start_date.toordinal()
     
-    return entries
+    for day_index in range(day_count):
+        day = date.fromordinal(start_ordinal + day_index).isoformat().encode()
+        yield _DAY_ENTRY_HEAD + day + b'",' + _DAY_ENTRY_TAILS[day_index % _DAY_TEMPLATE_CYCLE]
+
+
+def _logs_body_head(start_date, end_date):
+    """
+    Encode the log sheet response up to the opening of the entries array.
+    """
+    return (
+        b'{"log_sheet":{"start_date":' + orjson.dumps(start_date)
+        + b',"end_date":' + orjson.dumps(end_date) + b',"entries":['
+    )
+
+
+_LOGS_BODY_TAIL = b']}}'
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_logs_bytes(start_iso, end_iso):
+    """
+    Build and encode the log sheet response body for a date range.
+    Keyed by ISO strings so identical ranges reuse the encoded bytes.
+    """
+    start_date = datetime.fromisoformat(start_iso)
+    end_date = datetime.fromisoformat(end_iso)
+    
+    # Assemble the body from pre-encoded entries instead of dumping dicts
+    body = bytearray(_logs_body_head(start_date, end_date))
+    body += b','.join(iter_log_sheet_entries(start_date, end_date))
+    body += _LOGS_BODY_TAIL
+    return bytes(body)
+
+
+def _stream_logs(start_date, end_date):
+    """
+    Yield the log sheet response body one day at a time.
+    Produces the same bytes as _cached_logs_bytes without holding them all.
+    """
+    yield _logs_body_head(start_date, end_date)
+    separator = b''
+    for entry in iter_log_sheet_entries(start_date, end_date):
+        yield separator + entry
+        separator = b','
+    yield _LOGS_BODY_TAIL
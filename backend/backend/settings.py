@@ -127,7 +127,12 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
 }
 
@@ -152,3 +157,29 @@ _env_csrf_trusted = [o for o in os.getenv('CSRF_TRUSTED', '').split(',') if o]
 CSRF_TRUSTED_ORIGINS = _env_csrf_trusted or _default_csrf_trusted
 
 CORS_ALLOW_ALL_ORIGINS = DEBUG
+
+# Logging
+# Request threads only enqueue records; the handler's background listener
+# thread writes them to stderr, so logging never blocks a request.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'standard': {
+            'format': '%(asctime)s %(levelname)s %(name)s: %(message)s',
+        },
+    },
+    'handlers': {
+        'queue': {
+            '()': 'api.log_handlers.QueueStreamHandler',
+            'formatter': 'standard',
+        },
+    },
+    'loggers': {
+        'api': {
+            'handlers': ['queue'],
+            'level': os.getenv('API_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}